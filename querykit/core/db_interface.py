@@ -1,7 +1,39 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Iterable
+import logging
+import re
 import sqlite3
+import threading
 import mysql.connector
 
+logger = logging.getLogger(__name__)
+
+
+def _returns_rows(query: str) -> bool:
+    """Return True if the query is a SELECT, inspecting only its first keyword."""
+    return query.lstrip()[:6].upper() == "SELECT"
+
+
+def _begins_transaction(query: str) -> bool:
+    """Return True if the query explicitly opens a transaction or savepoint."""
+    keyword = query.lstrip()[:9].upper()
+    return keyword.startswith("BEGIN") or keyword == "SAVEPOINT"
+
+
+# String literals and quoted identifiers are matched first so a "?" inside
+# them is left alone.
+_QMARK_OR_QUOTED = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`|\?""")
+
+
+@lru_cache(maxsize=256)
+def _qmark_to_format(query: str) -> str:
+    """Rewrite qmark ("?") placeholders as format ("%s") placeholders."""
+    return _QMARK_OR_QUOTED.sub(
+        lambda match: "%s" if match.group() == "?" else match.group(), query
+    )
+
 
 class DBInterface(ABC):
     """
@@ -12,8 +44,13 @@ class DBInterface(ABC):
     connect():
         Establishes a connection to the database.
 
-    execute_query(query: str, params: tuple = ()):
+    execute_query(query: str, params: tuple = (), returns_rows: bool | None = None):
         Executes a query on the database with optional parameters.
+        If returns_rows is None, it is inferred from the query's first keyword.
+
+    execute_many(query: str, seq_of_params: Iterable[tuple]):
+        Executes a query once per parameter tuple. The default calls
+        execute_query in a loop; interfaces override it with a native batch.
 
     disconnect():
         Closes the database connection.
@@ -25,10 +62,21 @@ class DBInterface(ABC):
         pass
 
     @abstractmethod
-    def execute_query(self, query: str, params: tuple = ()):
+    def execute_query(
+        self, query: str, params: tuple = (), returns_rows: bool | None = None
+    ):
         """Execute a query on the database."""
         pass
 
+    def execute_many(self, query: str, seq_of_params: Iterable[tuple]):
+        """
+        Execute a query for each parameter tuple.
+        Subclasses should override this with a native batch operation; the
+        default runs execute_query once per tuple.
+        """
+        for params in seq_of_params:
+            self.execute_query(query, params)
+
     @abstractmethod
     def disconnect(self):
         """Close the database connection."""
@@ -43,46 +91,80 @@ class SQLiteInterface(DBInterface):
     -------
     db_path (str): The file path to the SQLite database.
     connection (sqlite3.Connection | None): The connection object to the SQLite database.
+    cached_statements (int): Size of the connection's prepared-statement cache.
 
     Methods:
     -------
-    __init__(db_path: str):
+    __init__(db_path: str, verbose: bool = False, cached_statements: int = 256):
         Initializes the SQLiteInterface with the given database path.
 
     connect():
         Establishes a connection to the SQLite database.
 
-    execute_query(query: str, params: tuple = ()):
+    execute_query(query: str, params: tuple = (), returns_rows: bool | None = None):
         Executes the given SQL query with optional parameters.
-        If the query is a SELECT statement, returns the fetched results.
-        Rolls back the transaction and raises a RuntimeError if an error occurs.
+        If the query returns rows (a SELECT statement), returns the fetched results.
+        Outside an explicit transaction, commits on success and rolls back on error.
+        Inside one (opened with BEGIN), commit and rollback are left to the caller.
+        Raises a RuntimeError if an error occurs.
+
+    execute_many(query: str, seq_of_params: Iterable[tuple]):
+        Executes the given SQL query once per parameter tuple in a single transaction,
+        or as part of the caller's transaction if one is open.
 
     disconnect():
         Closes the connection to the SQLite database if it is open.
     """
 
-    def __init__(self, db_path: str, verbose: bool = False):
+    def __init__(
+        self, db_path: str, verbose: bool = False, cached_statements: int = 256
+    ):
         self.db_path = db_path
         self.connection: sqlite3.Connection | None = None
         self.verbose = verbose
+        self.cached_statements = cached_statements
 
     def connect(self):
-        self.connection = sqlite3.connect(self.db_path)
+        # sqlite3 keeps compiled statements in a per-connection LRU keyed by SQL
+        # text, so repeated queries skip the parse/plan step.
+        self.connection = sqlite3.connect(
+            self.db_path, cached_statements=self.cached_statements
+        )
         if self.verbose:
             print(f"[+] Connected to SQLite database: {self.db_path}")
 
-    def execute_query(self, query: str, params: tuple = ()):
+    def execute_query(
+        self, query: str, params: tuple = (), returns_rows: bool | None = None
+    ):
         assert self.connection, "Database connection not established."
-        cursor = self.connection.cursor()
+        if returns_rows is None:
+            returns_rows = _returns_rows(query)
         try:
-            cursor.execute(query, params)
-            if query.strip().upper().startswith("SELECT"):
-                return cursor.fetchall()
+            # The connection context manager commits on success and rolls back
+            # on error; Connection.execute creates the cursor internally.
+            with self._transaction(query):
+                cursor = self.connection.execute(query, params)
+                if returns_rows:
+                    return cursor.fetchall()
         except Exception as e:
-            self.connection.rollback()
             raise RuntimeError(f"Error executing query: {e}")
-        finally:
-            cursor.close()
+
+    def execute_many(self, query: str, seq_of_params: Iterable[tuple]):
+        assert self.connection, "Database connection not established."
+        try:
+            with self._transaction(query):
+                self.connection.executemany(query, seq_of_params)
+        except Exception as e:
+            raise RuntimeError(f"Error executing query: {e}")
+
+    def _transaction(self, query: str):
+        """
+        Return the connection as a commit/rollback block, unless the caller
+        has an explicit transaction open or the query starts one.
+        """
+        if self.connection.in_transaction or _begins_transaction(query):
+            return nullcontext()
+        return self.connection
 
     def disconnect(self):
         if self.connection:
@@ -102,6 +184,13 @@ class MySQLInterface(DBInterface):
     password: The password to connect to the MySQL database
     db: The database name to connect
 
+    A single cursor is reused for every query and guarded by a lock, so the
+    interface can be shared between threads, although their queries then run
+    one at a time.
+
+    Queries may use either "%s" or "?" placeholders; "?" (as emitted by Insert)
+    is rewritten to "%s" for the connector when parameters are given.
+
     Methods:
     -------
     __init__(host: str, user: str, password: str, db: str):
@@ -110,8 +199,14 @@ class MySQLInterface(DBInterface):
     connect():
         Establishes a connection to the MySQL database using the provided credentials.
 
-    execute_query(query: str, params: tuple = ()):
-        Executes the given SQL query with optional parameters. If the query is a SELECT statement, returns the fetched results.
+    execute_query(query: str, params: tuple = (), returns_rows: bool | None = None):
+        Executes the given SQL query with optional parameters. If the query returns rows (a SELECT statement), returns the fetched results.
+        As with SQLiteInterface, commits on success and rolls back on error unless an
+        explicit transaction (opened with BEGIN) is in progress.
+
+    execute_many(query: str, seq_of_params: Iterable[tuple]):
+        Executes the given SQL query once per parameter tuple and commits the batch,
+        following the same transaction rule as execute_query.
 
     disconnect():
         Closes the connection to the MySQL database if it is open."""
@@ -125,28 +220,69 @@ class MySQLInterface(DBInterface):
         self.db = db
         self.connection = None
         self.verbose = verbose
+        self._cursor = None
+        self._lock = threading.Lock()
 
     def connect(self):
         self.connection = mysql.connector.connect(
             host=self.host, user=self.user, password=self.password, database=self.db
         )
+        # One cursor is reused for every call instead of creating one per query.
+        # It is buffered so rows left unfetched never block the next statement.
+        self._cursor = self.connection.cursor(buffered=True)
         if self.verbose:
             print(f"[+] Connected to MySQL DB @{self.host}")
 
-    def execute_query(self, query: str, params: tuple = ()):
+    def execute_query(
+        self, query: str, params: tuple = (), returns_rows: bool | None = None
+    ):
         assert self.connection, "Database connection not established."
-        with self.connection.cursor() as cursor:
+        if returns_rows is None:
+            returns_rows = _returns_rows(query)
+        if params:
+            query = _qmark_to_format(query)
+        with self._lock:
+            owns_transaction = self._owns_transaction(query)
             try:
-                print(query, params)
-                cursor.execute(query, params)
-                if query.strip().upper().startswith("SELECT"):
-                    return cursor.fetchall()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Executing query: %s %r", query, params)
+                self._cursor.execute(query, params)
+                rows = self._cursor.fetchall() if returns_rows else None
+                if owns_transaction:
+                    self.connection.commit()
+                return rows
+            except Exception as e:
+                if owns_transaction:
+                    self.connection.rollback()
+                raise RuntimeError(f"Error executing query: {e}")
+
+    def execute_many(self, query: str, seq_of_params: Iterable[tuple]):
+        assert self.connection, "Database connection not established."
+        query = _qmark_to_format(query)
+        with self._lock:
+            owns_transaction = self._owns_transaction(query)
+            try:
+                self._cursor.executemany(query, seq_of_params)
+                if owns_transaction:
+                    self.connection.commit()
             except Exception as e:
-                self.connection.rollback()
+                if owns_transaction:
+                    self.connection.rollback()
                 raise RuntimeError(f"Error executing query: {e}")
 
+    def _owns_transaction(self, query: str) -> bool:
+        """
+        Return True if the query should be committed (or rolled back) on its
+        own, i.e. the caller has no explicit transaction open and the query
+        does not start one.
+        """
+        return not (self.connection.in_transaction or _begins_transaction(query))
+
     def disconnect(self):
         if self.connection:
+            if self._cursor is not None:
+                self._cursor.close()
+                self._cursor = None
             self.connection.close()
             if self.verbose:
                 print(f"[-] Disconnected from MySQL DB @{self.host}")
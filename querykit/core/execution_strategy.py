@@ -1,3 +1,6 @@
+from typing import Iterable, MutableMapping
+import hashlib
+import inspect
 from querykit.core.sql_query import SQLQuery
 from querykit.core.db_interface import DBInterface
 
@@ -23,9 +26,89 @@ class PrintExecutionStrategy(ExecutionStrategy):
 
 
 class DBExecutionStrategy(ExecutionStrategy):
-    def __init__(self, db_interface: DBInterface):
+    """
+    Execution strategy that runs queries through a DBInterface.
+
+    The connection is owned by the caller and reused across executions. Used as
+    a context manager, the strategy connects on entry and disconnects on exit:
+
+        with DBExecutionStrategy(SQLiteInterface("app.db")) as executor:
+            executor.execute(query)
+
+    A single connection must not be used from several threads at once without
+    the caller serialising access (e.g. with a threading.Lock).
+
+    If a `cache` mapping is given, SELECT results are stored in it keyed by a
+    hash of the SQL and parameters, and any other statement executed through
+    this strategy clears it. Pass a mapping with its own eviction policy (e.g.
+    a TTL or LRU cache) to bound its size or age.
+    """
+
+    def __init__(
+        self,
+        db_interface: DBInterface,
+        cache: MutableMapping[bytes, tuple] | None = None,
+    ):
         self.db_interface = db_interface
+        self.cache = cache
+        # Interfaces written against the original execute_query(query, params)
+        # signature do not accept the returns_rows hint.
+        parameters = inspect.signature(db_interface.execute_query).parameters
+        self._accepts_returns_rows = "returns_rows" in parameters or any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+        )
+
+    def __enter__(self):
+        self.db_interface.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.db_interface.disconnect()
+
+    def _execute_query(
+        self, query_string: str, params: tuple, returns_rows: bool | None
+    ):
+        if returns_rows is None or not self._accepts_returns_rows:
+            return self.db_interface.execute_query(query_string, params)
+        return self.db_interface.execute_query(
+            query_string, params, returns_rows=returns_rows
+        )
 
     def execute(self, query: SQLQuery, params: tuple = ()):
         query_string = query.parse()
-        return self.db_interface.execute_query(query_string, params)
+        if query.params:
+            params = query.params + tuple(params)
+        # Queries made only of custom components have kind "OTHER"; leave it
+        # to the interface to decide whether they return rows.
+        returns_rows = None if query.kind == "OTHER" else query.kind == "SELECT"
+        if self.cache is None:
+            return self._execute_query(query_string, params, returns_rows)
+
+        if not returns_rows:
+            # Conditions are raw SQL and may reference any table, so a write
+            # cannot be attributed to specific cached results.
+            self.cache.clear()
+            return self._execute_query(query_string, params, returns_rows)
+
+        key = hashlib.blake2b(
+            f"{query_string}|{params!r}".encode(), digest_size=16
+        ).digest()
+        rows = self.cache.get(key)
+        if rows is None:
+            rows = self._execute_query(query_string, params, True)
+            # Store an immutable copy so callers cannot alter later cache hits.
+            self.cache[key] = tuple(rows)
+            return rows
+        return list(rows)
+
+    def execute_batch(self, query: SQLQuery, params_iter: Iterable[tuple]):
+        """
+        Execute the query once per parameter tuple, parsing it only once and
+        sending the whole batch to the database in a single call.
+        """
+        query_string = query.parse()
+        if query.params:
+            params_iter = (query.params + tuple(params) for params in params_iter)
+        if self.cache is not None:
+            self.cache.clear()
+        return self.db_interface.execute_many(query_string, params_iter)
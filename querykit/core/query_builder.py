@@ -11,8 +11,11 @@ class QueryBuilder:
 
     ! IMPORTANT !
     Each query builder instance should be used to build a single query, as it maintains state.
+    `build()` freezes the query; further builder calls raise a RuntimeError.
     """
 
+    __slots__ = ("query",)
+
     def __init__(self, strategy: QueryStrategy):
         self.query = SQLQuery(strategy)
 
@@ -71,4 +74,5 @@ class QueryBuilder:
         return self
 
     def build(self) -> SQLQuery:
-        return self.query
\ No newline at end of file
+        self.query.freeze()
+        return self.query
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 
 
@@ -6,8 +6,16 @@ class SQLQueryComponent:
     """
     Abstract base class for query components.
     Each component must implement the `to_sql` method.
+
+    The built-in components render their SQL once, when constructed, and treat
+    their attributes as read-only afterwards. Components that wrap another
+    component render it on every call, since the wrapped one may change.
+    SQLQuery cannot see inside custom components, so a query containing one is
+    re-rendered on every parse() instead of being served from its cache.
     """
 
+    __slots__ = ()
+
     def to_sql(self) -> str:
         raise NotImplementedError("Must be implemented in subclasses")
 
@@ -18,13 +26,19 @@ class Select(SQLQueryComponent):
     Represents the SELECT clause of a SQL query.
     """
 
+    __slots__ = ("columns", "_sql")
+
     def __init__(self, columns: List[str] | SQLQueryComponent):
         self.columns = columns
+        if isinstance(columns, SQLQueryComponent):
+            self._sql = None
+        else:
+            self._sql = "SELECT " + ", ".join(columns)
 
     def to_sql(self) -> str:
-        if isinstance(self.columns, SQLQueryComponent):
-            return f"SELECT {self.columns.to_sql()}"
-        return f"SELECT {', '.join(self.columns)}"
+        if self._sql is None:
+            return "SELECT " + self.columns.to_sql()
+        return self._sql
 
 
 class From(SQLQueryComponent):
@@ -32,13 +46,19 @@ class From(SQLQueryComponent):
     Represents the FROM clause of a SQL query.
     """
 
+    __slots__ = ("table", "_sql")
+
     def __init__(self, table: str | SQLQueryComponent):
         self.table = table
+        if isinstance(table, SQLQueryComponent):
+            self._sql = None
+        else:
+            self._sql = "FROM " + table
 
     def to_sql(self) -> str:
-        if isinstance(self.table, SQLQueryComponent):
-            return f"FROM {self.table.to_sql()}"
-        return f"FROM {self.table}"
+        if self._sql is None:
+            return "FROM " + self.table.to_sql()
+        return self._sql
 
 
 class Where(SQLQueryComponent):
@@ -46,13 +66,19 @@ class Where(SQLQueryComponent):
     Represents the WHERE clause of a SQL query.
     """
 
+    __slots__ = ("condition", "_sql")
+
     def __init__(self, condition: str | SQLQueryComponent):
         self.condition = condition
+        if isinstance(condition, SQLQueryComponent):
+            self._sql = None
+        else:
+            self._sql = "WHERE " + condition
 
     def to_sql(self) -> str:
-        if isinstance(self.condition, SQLQueryComponent):
-            return f"WHERE {self.condition.to_sql()}"
-        return f"WHERE {self.condition}"
+        if self._sql is None:
+            return "WHERE " + self.condition.to_sql()
+        return self._sql
 
 
 class OrderBy(SQLQueryComponent):
@@ -60,12 +86,15 @@ class OrderBy(SQLQueryComponent):
     Represents the ORDER BY clause of a SQL query.
     """
 
+    __slots__ = ("columns", "order", "_sql")
+
     def __init__(self, columns: List[str], order: Optional[str] = "ASC"):
         self.columns = columns
         self.order = order
+        self._sql = f"ORDER BY {', '.join(columns)} {order}"
 
     def to_sql(self) -> str:
-        return f"ORDER BY {', '.join(self.columns)} {self.order}"
+        return self._sql
 
 
 class Join(SQLQueryComponent):
@@ -73,12 +102,15 @@ class Join(SQLQueryComponent):
     Represents a JOIN clause in a SQL query.
     """
 
+    __slots__ = ("table", "condition", "_sql")
+
     def __init__(self, table: str, condition: str):
         self.table = table
         self.condition = condition
+        self._sql = f"JOIN {table} ON {condition}"
 
     def to_sql(self) -> str:
-        return f"JOIN {self.table} ON {self.condition}"
+        return self._sql
 
 
 class GroupBy(SQLQueryComponent):
@@ -86,11 +118,14 @@ class GroupBy(SQLQueryComponent):
     Represents the GROUP BY clause of a SQL query.
     """
 
+    __slots__ = ("columns", "_sql")
+
     def __init__(self, columns: List[str]):
         self.columns = columns
+        self._sql = "GROUP BY " + ", ".join(columns)
 
     def to_sql(self) -> str:
-        return f"GROUP BY {', '.join(self.columns)}"
+        return self._sql
 
 
 class Update(SQLQueryComponent):
@@ -98,11 +133,14 @@ class Update(SQLQueryComponent):
     Represents the UPDATE clause of a SQL query.
     """
 
+    __slots__ = ("table", "_sql")
+
     def __init__(self, table: str):
         self.table = table
+        self._sql = "UPDATE " + table
 
     def to_sql(self) -> str:
-        return f"UPDATE {self.table}"
+        return self._sql
 
 
 class Set(SQLQueryComponent):
@@ -110,11 +148,14 @@ class Set(SQLQueryComponent):
     Represents the SET clause in an UPDATE statement.
     """
 
+    __slots__ = ("updates", "_sql")
+
     def __init__(self, updates: List[str]):
         self.updates = updates
+        self._sql = "SET " + ", ".join(updates)
 
     def to_sql(self) -> str:
-        return f"SET {', '.join(self.updates)}"
+        return self._sql
 
 
 class Delete(SQLQueryComponent):
@@ -122,11 +163,14 @@ class Delete(SQLQueryComponent):
     Represents a DELETE statement in SQL.
     """
 
+    __slots__ = ("table", "_sql")
+
     def __init__(self, table: str):
         self.table = table
+        self._sql = "DELETE FROM " + table
 
     def to_sql(self) -> str:
-        return f"DELETE FROM {self.table}"
+        return self._sql
 
 
 class Limit(SQLQueryComponent):
@@ -134,27 +178,49 @@ class Limit(SQLQueryComponent):
     Represents the LIMIT clause of a SQL query.
     """
 
+    __slots__ = ("limit", "offset", "_sql")
+
     def __init__(self, limit: int, offset: Optional[int] = None):
         self.limit = limit
         self.offset = offset
+        if offset is not None:
+            self._sql = f"LIMIT {limit} OFFSET {offset}"
+        else:
+            self._sql = f"LIMIT {limit}"
 
     def to_sql(self) -> str:
-        if self.offset is not None:
-            return f"LIMIT {self.limit} OFFSET {self.offset}"
-        return f"LIMIT {self.limit}"
+        return self._sql
 
 
 class Insert(SQLQueryComponent):
     """
     Represents an INSERT INTO statement in SQL.
-    """
-
-    def __init__(self, table: str, columns: List[str], values: List[str]):
+    Values are emitted as placeholders and carried separately in `params`.
+    Without values, one placeholder per column is emitted and the values are
+    supplied at execution time (e.g. by DBExecutionStrategy.execute_batch).
+    The default "?" placeholder works with both SQLiteInterface and
+    MySQLInterface, which rewrites it to the connector's "%s".
+    """
+
+    __slots__ = ("table", "columns", "values", "params", "_sql")
+
+    def __init__(
+        self,
+        table: str,
+        columns: List[str],
+        values: Optional[List[Any]] = None,
+        placeholder: str = "?",
+    ):
         self.table = table
         self.columns = columns
         self.values = values
+        self.params = tuple(values) if values is not None else ()
+        placeholders = ", ".join(
+            [placeholder] * len(values if values is not None else columns)
+        )
+        self._sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        )
 
     def to_sql(self) -> str:
-        columns = ", ".join(self.columns)
-        values = ", ".join(f"'{v}'" for v in self.values)
-        return f"INSERT INTO {self.table} ({columns}) VALUES ({values})"
\ No newline at end of file
+        return self._sql
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Sequence
 from querykit.core.query_components import SQLQueryComponent
 
 
@@ -8,7 +8,7 @@ class QueryStrategy:
     Interface for query building strategies.
     """
 
-    def build_query(self, components: List[SQLQueryComponent]) -> str:
+    def build_query(self, components: Sequence[SQLQueryComponent]) -> str:
         raise NotImplementedError("Must be implemented in subclasses")
 
 
@@ -18,5 +18,5 @@ class StandardQueryStrategy(QueryStrategy):
     Simple strategy to concatenate components in order.
     """
 
-    def build_query(self, components: List[SQLQueryComponent]) -> str:
-        return " ".join(component.to_sql() for component in components)
+    def build_query(self, components: Sequence[SQLQueryComponent]) -> str:
+        return " ".join([component.to_sql() for component in components])
@@ -1,77 +1,243 @@
-from typing import List
+from functools import lru_cache
+from operator import is_
+from typing import List, Literal
 from querykit.core.query_components import *
 from querykit.core.query_strategy import QueryStrategy
 
 
+QueryKind = Literal["SELECT", "INSERT", "UPDATE", "DELETE", "OTHER"]
+
+# Components are read-only once built, so queries on the same table can share
+# a single FROM clause instead of each allocating and rendering its own. Only
+# plain table names are shared; wrapped components get their own From.
+_shared_from = lru_cache(maxsize=256)(From)
+
+
 # Context class
 class SQLQuery:
     """
     Context for building and executing SQL queries.
+
+    `kind` records the statement type as components are added, so executors
+    can tell whether the query returns rows without inspecting the SQL text.
+    `params` collects the bind values carried by components (e.g. Insert), in
+    the order their placeholders appear.
     """
 
+    __slots__ = (
+        "strategy",
+        "_build",
+        "components",
+        "select_component",
+        "from_component",
+        "kind",
+        "params",
+        "_has_update",
+        "_has_set",
+        "_has_delete",
+        "_subqueries",
+        "_prefix_subqueries",
+        "_subquery_sql",
+        "_opaque",
+        "_prefix_opaque",
+        "_validated",
+        "_frozen",
+        "_assembled",
+        "_version",
+        "_cached_sql",
+        "_cached_version",
+    )
+
     def __init__(self, strategy: QueryStrategy):
         self.strategy = strategy
-        self.components: List[SQLQueryComponent] = []
+        self._build = strategy.build_query
+        self.components: List[SQLQueryComponent] | tuple = []
         self.select_component = None
         self.from_component = None
+        self.kind: QueryKind = "OTHER"
+        self.params: tuple = ()
+        self._has_update = False
+        self._has_set = False
+        self._has_delete = False
+        self._subqueries: List[Subquery] = []
+        self._prefix_subqueries: tuple = ()
+        # Subquery SQL the cached string was rendered with, compared by identity.
+        self._subquery_sql: tuple = ()
+        # Custom components may render differently on every call, so a query
+        # containing one is never served from the cache.
+        self._opaque = False
+        self._prefix_opaque = False
+        self._validated = False
+        self._frozen = False
+        self._assembled: tuple | None = None
+        # Bumped on every change; the cached SQL is valid for one version only.
+        self._version = 0
+        self._cached_sql: str | None = None
+        self._cached_version = -1
+
+    def _modified(self):
+        """
+        Invalidate cached state after a structural change.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot modify a query after it has been built.")
+        self._version += 1
+        self._validated = False
 
     def set_select(self, columns: List[str]):
         """
         Set the SELECT clause of the query.
         """
+        self._modified()
         self.select_component = Select(columns)
+        self.kind = "SELECT"
+        self._track_prefix_subqueries()
 
-    def set_from(self, table: str):
+    def set_from(self, table: str | SQLQueryComponent):
         """
         Set the FROM clause of the query.
         """
-        self.from_component = From(table)
+        self._modified()
+        if isinstance(table, str):
+            self.from_component = _shared_from(table)
+        else:
+            self.from_component = From(table)
+        self._track_prefix_subqueries()
+
+    def _track_prefix_subqueries(self):
+        """
+        Record subqueries and custom components wrapped by the SELECT and FROM
+        clauses.
+        """
+        subqueries = []
+        opaque = False
+        for component in (self.select_component, self.from_component):
+            if component is not None:
+                subquery, component_opaque = _inspect_component(component)
+                if subquery is not None:
+                    subqueries.append(subquery)
+                opaque = opaque or component_opaque
+        self._prefix_subqueries = tuple(subqueries)
+        self._prefix_opaque = opaque
 
     def add_component(self, component: SQLQueryComponent):
         """
         Add a component to the query.
         """
+        self._modified()
+        if isinstance(self.components, tuple):
+            self.components = list(self.components)
         self.components.append(component)
+        params = getattr(component, "params", None)
+        if params:
+            self.params += params
+        if isinstance(component, Select):
+            self.kind = "SELECT"
+        elif isinstance(component, Insert):
+            self.kind = "INSERT"
+        elif isinstance(component, Update):
+            self.kind = "UPDATE"
+            self._has_update = True
+        elif isinstance(component, Set):
+            self._has_set = True
+        elif isinstance(component, Delete):
+            self.kind = "DELETE"
+            self._has_delete = True
+
+        subquery, opaque = _inspect_component(component)
+        if subquery is not None:
+            self._subqueries.append(subquery)
+        if opaque:
+            self._opaque = True
 
     def set_strategy(self, strategy: QueryStrategy):
         """
         Set the query building strategy.
         """
         self.strategy = strategy
+        self._build = strategy.build_query
+        self._version += 1
+
+    def freeze(self):
+        """
+        Validate the query and mark it as complete. Any further structural
+        change raises a RuntimeError.
+        """
+        self.validate()
+        # The clause sequence can no longer change, so assemble it once here
+        # instead of on every parse().
+        self._assembled = (
+            tuple(c for c in (self.select_component, self.from_component) if c)
+            + self.components
+        )
+        self._frozen = True
 
     def validate(self):
         """
         Validate the structure and logical consistency of the query.
+        parse() only calls this again after the query has been modified.
         """
         if self.select_component and not self.from_component:
             raise ValueError("SELECT query requires a FROM clause.")
-        if any(isinstance(c, Update) for c in self.components) and not any(
-            isinstance(c, Set) for c in self.components
-        ):
+        if self._has_update and not self._has_set:
             raise ValueError("UPDATE query requires a SET clause.")
-        if any(isinstance(c, Delete) for c in self.components) and self.from_component:
+        if self._has_delete and self.from_component:
             raise ValueError("DELETE query should not have a FROM clause explicitly.")
 
         # Ensure subqueries are properly validated
-        for component in self.components:
-            if isinstance(component, Subquery):
-                component.query.validate()
+        for subquery in (*self._prefix_subqueries, *self._subqueries):
+            subquery.query.validate()
+
+        # Store validated components as a tuple; add_component turns it back
+        # into a list if the query is modified.
+        self.components = tuple(self.components)
+        self._validated = True
 
     def parse(self) -> str:
         """
         Build and return the SQL query string.
+        The result is cached until the query or one of its subqueries is modified.
+        Queries containing custom components are rendered on every call.
         """
-        self.validate()
+        if self._prefix_subqueries or self._subqueries:
+            # A subquery's parse() returns the same string object while it is
+            # unchanged, so identity tells whether the cached SQL is current.
+            subquery_sql = tuple(
+                subquery.query.parse()
+                for subquery in (*self._prefix_subqueries, *self._subqueries)
+            )
+        else:
+            subquery_sql = ()
+        if (
+            self._cached_version == self._version
+            and not self._opaque
+            and not self._prefix_opaque
+            and all(map(is_, subquery_sql, self._subquery_sql))
+        ):
+            return self._cached_sql
+
+        if not self._validated:
+            self.validate()
 
-        full_components = []
-        if self.select_component:
-            full_components.append(self.select_component)
-        if self.from_component:
-            full_components.append(self.from_component)
-        full_components.extend(self.components)
+        full_components = self._assembled
+        if full_components is None:
+            if self.select_component and self.from_component:
+                # Common SELECT ... FROM ... shape: no filtering needed.
+                full_components = (
+                    self.select_component,
+                    self.from_component,
+                    *self.components,
+                )
+            else:
+                full_components = (
+                    *(c for c in (self.select_component, self.from_component) if c),
+                    *self.components,
+                )
 
-        query = self.strategy.build_query(full_components)
-        return query
+        self._cached_sql = self._build(full_components)
+        self._cached_version = self._version
+        self._subquery_sql = subquery_sql
+        return self._cached_sql
 
 
 class Subquery(SQLQueryComponent):
@@ -79,6 +245,8 @@ class Subquery(SQLQueryComponent):
     Represents a subquery that can be used in various SQL clauses.
     """
 
+    __slots__ = ("query",)
+
     def __init__(self, query: SQLQuery):
         """
         Initializes a Subquery with an SQLQuery instance.
@@ -92,4 +260,30 @@ class Subquery(SQLQueryComponent):
         """
         Converts the subquery to a string representation wrapped in parentheses.
         """
-        return f"({self.query.parse()})"
\ No newline at end of file
+        return "(" + self.query.parse() + ")"
+
+
+# Clauses that may wrap another component instead of a plain string.
+_WRAPPED_ATTRIBUTES = {Select: "columns", From: "table", Where: "condition"}
+
+_BUILTIN_COMPONENTS = frozenset(
+    (Select, From, Where, OrderBy, Join, GroupBy, Update, Set, Delete, Limit, Insert)
+)
+
+
+def _inspect_component(component) -> tuple[Subquery | None, bool]:
+    """
+    Return the Subquery that `component` is or wraps (through Select, From or
+    Where), or None, and whether the chain ends in a custom component whose
+    output parse() cannot track. Subclasses of built-in components count as
+    custom, since they may override to_sql.
+    """
+    while True:
+        component_type = type(component)
+        if component_type is Subquery:
+            return component, False
+        attribute = _WRAPPED_ATTRIBUTES.get(component_type)
+        if attribute is not None and component._sql is None:
+            component = getattr(component, attribute)
+            continue
+        return None, component_type not in _BUILTIN_COMPONENTS
@@ -1,7 +1,14 @@
+import os
+import tempfile
 import unittest
 import sqlite3
 from mysql.connector import connect, Error as MySQLError
 from querykit.core.db_interface import SQLiteInterface, MySQLInterface
+from querykit.core.execution_strategy import DBExecutionStrategy
+from querykit.core.query_components import Insert
+from querykit.core.query_builder import QueryBuilder
+from querykit.core.query_strategy import StandardQueryStrategy
+from querykit.core.sql_query import SQLQuery
 
 class TestSQLiteInterface(unittest.TestCase):
     def setUp(self):
@@ -32,6 +39,194 @@ class TestSQLiteInterface(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.db.execute_query("SELECT * FROM non_existing_table")
 
+    def test_execute_many(self):
+        self.db.execute_query("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+        self.db.execute_many("INSERT INTO test (name) VALUES (?)", [("Alice",), ("Bob",)])
+        result = self.db.execute_query("SELECT name FROM test ORDER BY id")
+        self.assertEqual(result, [("Alice",), ("Bob",)])
+
+
+class TestSQLiteInterfaceTransactions(unittest.TestCase):
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db = SQLiteInterface(self.db_path)
+        self.db.connect()
+        self.db.execute_query("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT UNIQUE)")
+
+    def tearDown(self):
+        self.db.disconnect()
+        os.remove(self.db_path)
+
+    def reconnect(self):
+        self.db.disconnect()
+        self.db = SQLiteInterface(self.db_path)
+        self.db.connect()
+
+    def test_insert_survives_reconnect(self):
+        self.db.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        self.reconnect()
+        self.assertEqual(self.db.execute_query("SELECT name FROM test"), [("Alice",)])
+
+    def test_failed_statement_rolled_back(self):
+        self.db.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        with self.assertRaises(RuntimeError):
+            self.db.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        self.assertFalse(self.db.connection.in_transaction)
+        # The whole batch runs in one block, so the row before the failure is
+        # rolled back too.
+        with self.assertRaises(RuntimeError):
+            self.db.execute_many("INSERT INTO test (name) VALUES (?)", [("Bob",), ("Alice",)])
+        self.assertFalse(self.db.connection.in_transaction)
+        self.reconnect()
+        self.assertEqual(self.db.execute_query("SELECT name FROM test"), [("Alice",)])
+
+    def test_explicit_transaction_commit(self):
+        self.db.execute_query("BEGIN")
+        self.db.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        self.db.execute_many("INSERT INTO test (name) VALUES (?)", [("Bob",)])
+        self.assertTrue(self.db.connection.in_transaction)
+        self.db.execute_query("COMMIT")
+        self.reconnect()
+        self.assertEqual(
+            self.db.execute_query("SELECT name FROM test ORDER BY id"), [("Alice",), ("Bob",)]
+        )
+
+    def test_explicit_transaction_rollback(self):
+        self.db.execute_query("BEGIN")
+        self.db.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        self.db.execute_query("ROLLBACK")
+        self.reconnect()
+        self.assertEqual(self.db.execute_query("SELECT name FROM test"), [])
+
+
+class TestDBInterfaceDefaults(unittest.TestCase):
+    def test_execute_many_default(self):
+        from querykit.core.db_interface import DBInterface
+
+        class RecordingInterface(DBInterface):
+            def __init__(self):
+                self.calls = []
+
+            def connect(self):
+                pass
+
+            def execute_query(self, query, params=()):
+                self.calls.append((query, params))
+
+            def disconnect(self):
+                pass
+
+        db = RecordingInterface()
+        db.execute_many("INSERT INTO test (name) VALUES (?)", [("Alice",), ("Bob",)])
+        self.assertEqual(
+            db.calls,
+            [
+                ("INSERT INTO test (name) VALUES (?)", ("Alice",)),
+                ("INSERT INTO test (name) VALUES (?)", ("Bob",)),
+            ],
+        )
+
+
+class TestDBExecutionStrategy(unittest.TestCase):
+    def test_context_manager_opens_and_closes_connection(self):
+        db = SQLiteInterface(":memory:")
+        with DBExecutionStrategy(db) as executor:
+            self.assertIs(executor.db_interface, db)
+            self.assertIsNotNone(db.connection)
+            self.assertEqual(db.execute_query("SELECT 1"), [(1,)])
+        with self.assertRaises(sqlite3.ProgrammingError):
+            db.connection.execute("SELECT 1")
+
+    def test_custom_component_query_returns_rows(self):
+        from querykit.core.query_components import SQLQueryComponent
+        from querykit.core.sql_query import SQLQuery
+
+        class RawSQL(SQLQueryComponent):
+            def to_sql(self):
+                return "SELECT 1"
+
+        query = SQLQuery(StandardQueryStrategy())
+        query.add_component(RawSQL())
+        with DBExecutionStrategy(SQLiteInterface(":memory:")) as executor:
+            self.assertEqual(executor.execute(query), [(1,)])
+
+
+class TestDBExecutionStrategyCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = {}
+        self.executor = DBExecutionStrategy(SQLiteInterface(":memory:"), cache=self.cache)
+        self.executor.db_interface.connect()
+        self.executor.db_interface.execute_query("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+
+    def tearDown(self):
+        self.executor.db_interface.disconnect()
+
+    def test_select_results_cached(self):
+        query = QueryBuilder(StandardQueryStrategy()).select(["name"]).from_table("test").build()
+        self.assertEqual(self.executor.execute(query), [])
+        self.assertEqual(len(self.cache), 1)
+        # Bypass the strategy so the cache is not invalidated: a cache hit
+        # must not see the new row.
+        self.executor.db_interface.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        self.assertEqual(self.executor.execute(query), [])
+
+    def test_cached_results_are_copies(self):
+        query = QueryBuilder(StandardQueryStrategy()).select(["name"]).from_table("test").build()
+        self.executor.execute(query).append(("junk",))
+        self.executor.execute(query).append(("junk",))
+        self.assertEqual(self.executor.execute(query), [])
+
+    def test_write_clears_cache(self):
+        query = QueryBuilder(StandardQueryStrategy()).select(["name"]).from_table("test").build()
+        self.executor.execute(query)
+        self.executor.execute(QueryBuilder(StandardQueryStrategy()).delete("test").build())
+        self.assertEqual(self.cache, {})
+
+
+class TestDBExecutionStrategyBatch(unittest.TestCase):
+    def setUp(self):
+        self.cache = {}
+        self.executor = DBExecutionStrategy(SQLiteInterface(":memory:"), cache=self.cache)
+        self.executor.db_interface.connect()
+        self.executor.db_interface.execute_query("CREATE TABLE test (tag TEXT, name TEXT)")
+
+    def tearDown(self):
+        self.executor.db_interface.disconnect()
+
+    def select_all(self):
+        return self.executor.db_interface.execute_query("SELECT tag, name FROM test ORDER BY name")
+
+    def test_insert_without_values(self):
+        query = SQLQuery(StandardQueryStrategy())
+        query.add_component(Insert("test", ["tag", "name"]))
+        self.executor.execute_batch(query, [("a", "Alice"), ("b", "Bob")])
+        self.assertEqual(self.select_all(), [("a", "Alice"), ("b", "Bob")])
+
+    def test_query_params_prepended(self):
+        from querykit.core.query_components import SQLQueryComponent
+
+        class TaggedInsert(SQLQueryComponent):
+            params = ("x",)
+
+            def to_sql(self):
+                return "INSERT INTO test (tag, name) VALUES (?, ?)"
+
+        query = SQLQuery(StandardQueryStrategy())
+        query.add_component(TaggedInsert())
+        self.executor.execute_batch(query, [("Alice",), ("Bob",)])
+        self.assertEqual(self.select_all(), [("x", "Alice"), ("x", "Bob")])
+
+    def test_batch_clears_cache(self):
+        select = QueryBuilder(StandardQueryStrategy()).select(["name"]).from_table("test").build()
+        self.executor.execute(select)
+        self.assertEqual(len(self.cache), 1)
+        query = SQLQuery(StandardQueryStrategy())
+        query.add_component(Insert("test", ["tag", "name"]))
+        self.executor.execute_batch(query, [("a", "Alice")])
+        self.assertEqual(self.cache, {})
+        self.assertEqual(self.executor.execute(select), [("Alice",)])
+
 
 class TestMySQLInterface(unittest.TestCase):
     def setUp(self):
@@ -69,5 +264,78 @@ class TestMySQLInterface(unittest.TestCase):
             self.db.execute_query("SELECT * FROM non_existing_table")
 
 
+class FakeMySQLCursor:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, query, params=()):
+        self.calls.append((query, params))
+
+    def executemany(self, query, seq_of_params):
+        self.calls.append((query, list(seq_of_params)))
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class FakeMySQLConnection:
+    def __init__(self):
+        self.in_transaction = False
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+class TestMySQLInterfaceFakeCursor(unittest.TestCase):
+    def setUp(self):
+        self.db = MySQLInterface("localhost", "root", "password", "test_db")
+        self.db.connection = FakeMySQLConnection()
+        self.db._cursor = self.cursor = FakeMySQLCursor()
+
+    def test_insert_placeholders_translated(self):
+        query = SQLQuery(StandardQueryStrategy())
+        query.add_component(Insert("test", ["name", "note"], ["Alice", "?"]))
+        DBExecutionStrategy(self.db).execute(query)
+        self.assertEqual(
+            self.cursor.calls,
+            [("INSERT INTO test (name, note) VALUES (%s, %s)", ("Alice", "?"))],
+        )
+
+    def test_execute_many_placeholders_translated(self):
+        self.db.execute_many("INSERT INTO test (name) VALUES (?)", [("Alice",)])
+        self.assertEqual(
+            self.cursor.calls, [("INSERT INTO test (name) VALUES (%s)", [("Alice",)])]
+        )
+
+    def test_execute_query_and_execute_many_commit(self):
+        self.db.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        self.db.execute_many("INSERT INTO test (name) VALUES (?)", [("Bob",)])
+        self.assertEqual(self.db.connection.commits, 2)
+
+    def test_explicit_transaction_left_to_caller(self):
+        self.db.execute_query("BEGIN")
+        self.db.connection.in_transaction = True
+        self.db.execute_query("INSERT INTO test (name) VALUES (?)", ("Alice",))
+        self.db.execute_many("INSERT INTO test (name) VALUES (?)", [("Bob",)])
+        self.assertEqual(self.db.connection.commits, 0)
+
+    def test_quoted_question_marks_kept(self):
+        self.db.execute_query("SELECT '?', `a?` FROM test WHERE name = ?", ("Alice",))
+        self.assertEqual(
+            self.cursor.calls, [("SELECT '?', `a?` FROM test WHERE name = %s", ("Alice",))]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
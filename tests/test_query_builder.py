@@ -49,5 +49,51 @@ class TestQueryBuilder(unittest.TestCase):
         query = self.builder.delete('users').build()
         self.assertIn('DELETE FROM users', query.parse())
 
+    def test_kind(self):
+        self.assertEqual(self.builder.select(['*']).from_table('users').build().kind, 'SELECT')
+        self.assertEqual(QueryBuilder(self.strategy).delete('users').build().kind, 'DELETE')
+
+    def test_build_freezes_query(self):
+        query = self.builder.select(['*']).from_table('users').build()
+        self.assertIsInstance(query.components, tuple)
+        with self.assertRaises(RuntimeError):
+            self.builder.where('age > 30')
+
+    def test_build_validates(self):
+        with self.assertRaises(ValueError):
+            self.builder.select(['*']).build()
+
+    def test_insert_uses_placeholders(self):
+        from querykit.core.query_components import Insert
+        query = SQLQuery(self.strategy)
+        query.add_component(Insert('users', ['name', 'age'], ['Alice', 30]))
+        self.assertEqual(query.parse(), 'INSERT INTO users (name, age) VALUES (?, ?)')
+        self.assertEqual(query.params, ('Alice', 30))
+
+    def test_from_shared_for_table_names_only(self):
+        from querykit.core.sql_query import Subquery
+        first = SQLQuery(self.strategy)
+        first.set_from('users')
+        second = SQLQuery(self.strategy)
+        second.set_from('users')
+        self.assertIs(first.from_component, second.from_component)
+        inner = SQLQuery(self.strategy)
+        inner.set_select(['*'])
+        inner.set_from('users')
+        subquery = Subquery(inner)
+        first.set_from(subquery)
+        second.set_from(subquery)
+        self.assertIsNot(first.from_component, second.from_component)
+
+    def test_parse_cached_until_modified(self):
+        from querykit.core.query_components import Where
+        query = SQLQuery(self.strategy)
+        query.set_select(['*'])
+        query.set_from('users')
+        self.assertIs(query.parse(), query.parse())
+        query.add_component(Where('age > 30'))
+        self.assertEqual(query.parse(), 'SELECT * FROM users WHERE age > 30')
+        self.assertIsInstance(query.components, tuple)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
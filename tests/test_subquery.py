@@ -0,0 +1,116 @@
+import unittest
+from querykit.core.query_components import SQLQueryComponent, Where
+from querykit.core.query_strategy import StandardQueryStrategy
+from querykit.core.sql_query import SQLQuery, Subquery
+
+class TestSubquery(unittest.TestCase):
+
+    def setUp(self):
+        self.strategy = StandardQueryStrategy()
+        self.inner = SQLQuery(self.strategy)
+        self.inner.set_select(['id'])
+        self.inner.set_from('orders')
+
+    def test_to_sql(self):
+        self.assertEqual(Subquery(self.inner).to_sql(), '(SELECT id FROM orders)')
+
+    def test_to_sql_tracks_inner_changes(self):
+        subquery = Subquery(self.inner)
+        self.assertEqual(subquery.to_sql(), '(SELECT id FROM orders)')
+        self.inner.add_component(Where('total > 10'))
+        self.assertEqual(subquery.to_sql(), '(SELECT id FROM orders WHERE total > 10)')
+
+    def test_outer_query_rerenders_when_inner_changes(self):
+        outer = SQLQuery(self.strategy)
+        outer.set_select(['name'])
+        outer.set_from('users')
+        outer.add_component(Where('id IN'))
+        outer.add_component(Subquery(self.inner))
+        self.assertEqual(outer.parse(), 'SELECT name FROM users WHERE id IN (SELECT id FROM orders)')
+        self.inner.add_component(Where('total > 10'))
+        self.assertEqual(
+            outer.parse(),
+            'SELECT name FROM users WHERE id IN (SELECT id FROM orders WHERE total > 10)',
+        )
+
+    def test_where_wrapping_subquery_rerenders(self):
+        outer = SQLQuery(self.strategy)
+        outer.set_select(['name'])
+        outer.set_from('users')
+        outer.add_component(Where(Subquery(self.inner)))
+        self.assertEqual(outer.parse(), 'SELECT name FROM users WHERE (SELECT id FROM orders)')
+        self.inner.add_component(Where('total > 10'))
+        self.assertEqual(
+            outer.parse(),
+            'SELECT name FROM users WHERE (SELECT id FROM orders WHERE total > 10)',
+        )
+
+    def test_from_subquery_rerenders(self):
+        outer = SQLQuery(self.strategy)
+        outer.set_select(['id'])
+        outer.set_from(Subquery(self.inner))
+        self.assertEqual(outer.parse(), 'SELECT id FROM (SELECT id FROM orders)')
+        self.inner.add_component(Where('total > 10'))
+        self.assertEqual(outer.parse(), 'SELECT id FROM (SELECT id FROM orders WHERE total > 10)')
+
+    def _outer(self, component):
+        outer = SQLQuery(self.strategy)
+        outer.set_select(['name'])
+        outer.set_from('users')
+        outer.add_component(component)
+        return outer
+
+    def test_shared_subquery_rerenders_every_consumer(self):
+        subquery = Subquery(self.inner)
+        first = self._outer(Where(subquery))
+        second = self._outer(Where(subquery))
+        self.assertEqual(first.parse(), 'SELECT name FROM users WHERE (SELECT id FROM orders)')
+        self.assertEqual(second.parse(), 'SELECT name FROM users WHERE (SELECT id FROM orders)')
+        self.inner.add_component(Where('total > 10'))
+        self.assertEqual(
+            first.parse(),
+            'SELECT name FROM users WHERE (SELECT id FROM orders WHERE total > 10)',
+        )
+        self.assertEqual(
+            second.parse(),
+            'SELECT name FROM users WHERE (SELECT id FROM orders WHERE total > 10)',
+        )
+
+    def test_direct_to_sql_does_not_hide_inner_changes(self):
+        subquery = Subquery(self.inner)
+        outer = self._outer(Where(subquery))
+        outer.parse()
+        self.inner.add_component(Where('total > 10'))
+        self.assertEqual(subquery.to_sql(), '(SELECT id FROM orders WHERE total > 10)')
+        self.assertEqual(
+            outer.parse(),
+            'SELECT name FROM users WHERE (SELECT id FROM orders WHERE total > 10)',
+        )
+
+    def test_custom_component_wrapping_subquery_rerenders(self):
+        class In(SQLQueryComponent):
+            def __init__(self, column, subquery):
+                self.column = column
+                self.subquery = subquery
+
+            def to_sql(self):
+                return 'WHERE ' + self.column + ' IN ' + self.subquery.to_sql()
+
+        outer = self._outer(In('id', Subquery(self.inner)))
+        self.assertEqual(outer.parse(), 'SELECT name FROM users WHERE id IN (SELECT id FROM orders)')
+        self.inner.add_component(Where('total > 10'))
+        self.assertEqual(
+            outer.parse(),
+            'SELECT name FROM users WHERE id IN (SELECT id FROM orders WHERE total > 10)',
+        )
+
+    def test_invalid_inner_query(self):
+        inner = SQLQuery(self.strategy)
+        inner.set_select(['id'])
+        outer = SQLQuery(self.strategy)
+        outer.add_component(Subquery(inner))
+        with self.assertRaises(ValueError):
+            outer.parse()
+
+if __name__ == '__main__':
+    unittest.main()